@@ -1,18 +1,41 @@
+import asyncio
+from typing import Optional
 from uuid import UUID
 
 from app.models.models import Message
 from app.schemas.schemas import Message_Pydantic_Show
 from app.worker.tasks import send_sms
 
+# Fields of Message_Pydantic_Show (id, phone, message_body, user_id), taken
+# from the schema so queries and responses cannot drift from it.
+MESSAGE_FIELDS = tuple(Message_Pydantic_Show.__fields__)
 
-async def get_messages(user: UUID):
-    return await Message_Pydantic_Show.from_queryset(Message.all().filter(user_id=user))
+
+async def get_messages(user: UUID, limit: int, before_id: Optional[int] = None):
+    queryset = Message.filter(user_id=user)
+    if before_id is not None:
+        queryset = queryset.filter(id__lt=before_id)
+    return await queryset.order_by("-id").limit(limit).values(*MESSAGE_FIELDS)
 
 
 async def send_message(**kwargs):
-    send_sms.delay(kwargs.get("phone"), kwargs.get("message_body"))
-    return await Message.create(
-        user_id=kwargs.get("user_id"),
-        phone=kwargs.get("phone"),
-        message_body=kwargs.get("message_body"),
+    # The broker publish is blocking, run it off the event loop while the
+    # message row is inserted.
+    enqueued, message = await asyncio.gather(
+        asyncio.to_thread(
+            send_sms.delay, kwargs.get("phone"), kwargs.get("message_body")
+        ),
+        Message.create(
+            user_id=kwargs.get("user_id"),
+            phone=kwargs.get("phone"),
+            message_body=kwargs.get("message_body"),
+        ),
+        return_exceptions=True,
     )
+    if isinstance(message, BaseException):
+        raise message
+    if isinstance(enqueued, BaseException):
+        # Don't keep a row for a message that was never queued for sending.
+        await message.delete()
+        raise enqueued
+    return message
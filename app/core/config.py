@@ -6,6 +6,9 @@ load_dotenv("./.env")
 
 # DB config.
 DATABASE_URL = os.environ["DATABASE_URL"]
+# Create missing tables on startup. Keep it off in production so workers
+# don't all probe the schema on boot.
+GENERATE_SCHEMAS = os.environ.get("GENERATE_SCHEMAS") == "1"
 
 # App config.
 
@@ -17,3 +20,6 @@ API_SECRET_KEY = os.environ["API_SECRET_KEY"]
 BROKER_URL_MAIN = os.environ["BROKER_URL"]
 RESULT_BACKEND = os.environ["RESULT_BACKEND"]
 RATE_LIMIT = os.environ["RATE_LIMIT"]
+
+# SMS gateway config.
+ANDROID_DEVICE = os.environ["ANDROID_DEVICE"]
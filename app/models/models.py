@@ -1,6 +1,6 @@
 from fastapi_users import models
 from fastapi_users.db import TortoiseBaseUserModel
-from tortoise import fields
+from tortoise import Tortoise, fields
 from tortoise.contrib.pydantic import PydanticModel
 from tortoise.models import Model
 
@@ -37,5 +37,14 @@ class Message(Model):
         "models.UserModel", related_name="messages"
     )
 
+    class Meta:
+        # Serves the per-user listing (filter by user, newest first).
+        indexes = (("user_id", "id"),)
+
     def __str__(self):
         return self.phone
+
+
+# Resolve relations as soon as the models are defined, so every
+# pydantic_model_creator call (app.schemas) sees the final model metadata.
+Tortoise.init_models(["app.models.models"], "models")
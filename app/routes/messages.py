@@ -1,8 +1,9 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import ORJSONResponse
 
-from app.api.messages import get_messages, send_message
+from app.api.messages import MESSAGE_FIELDS, get_messages, send_message
 from app.api.users import current_active_user
 from app.models.models import UserDB
 from app.schemas.schemas import Message_Pydantic_Create, Message_Pydantic_Show
@@ -11,8 +12,16 @@ router = APIRouter(tags=["Messages"], prefix="/messages")
 
 
 @router.get("", response_model=List[Message_Pydantic_Show])
-async def get_all(user: UserDB = Depends(current_active_user)):
-    return await get_messages(user=user.id)
+async def get_all(
+    limit: int = Query(default=10, ge=1, le=100),
+    before_id: Optional[int] = Query(default=None, ge=1),
+    user: UserDB = Depends(current_active_user),
+):
+    # get_messages selects exactly Message_Pydantic_Show's fields, so skip
+    # response_model validation and jsonable_encoder; it still documents the route.
+    return ORJSONResponse(
+        await get_messages(user=user.id, limit=limit, before_id=before_id)
+    )
 
 
 @router.post(
@@ -21,4 +30,5 @@ async def get_all(user: UserDB = Depends(current_active_user)):
 async def create_message(
     request: Message_Pydantic_Create, user: UserDB = Depends(current_active_user)
 ):
-    return await send_message(user_id=user.id, **request.dict())
+    message = await send_message(user_id=user.id, **request.dict())
+    return ORJSONResponse({field: getattr(message, field) for field in MESSAGE_FIELDS})
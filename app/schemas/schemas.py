@@ -15,5 +15,5 @@ Message_Pydantic_Show = pydantic_model_creator(
 
 
 class Message_Pydantic_Create(BaseModel):
-    phone: constr(strip_whitespace=True, regex="(\+?53)?5\d{7}")
+    phone: constr(strip_whitespace=True, regex=r"^(?:\+?53)?5\d{7}$")
     message_body: constr(strip_whitespace=True, min_length=1, max_length=160)
@@ -1,19 +1,37 @@
-import os
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.config import ANDROID_DEVICE
 
 from .celery_app import app
 
-ANDROID_DEVICE = os.environ["ANDROID_DEVICE"]
+# One keep-alive session per worker process, reused across tasks.
+_session = requests.Session()
+_session.headers["Connection"] = "keep-alive"
+_session.headers["Content-Type"] = "application/json"
+_adapter = HTTPAdapter(
+    pool_connections=16, pool_maxsize=64, max_retries=0, pool_block=True
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
 
 @app.task
 def check_balance():
     raise NotImplementedError
 
 
-@app.task(autoretry_for=([requests.exceptions.RequestException]), retry_backoff=True)
+@app.task(
+    autoretry_for=([requests.exceptions.RequestException]),
+    retry_backoff=True,
+    ignore_result=True,
+)
 def send_sms(phone: str, message_body: str) -> int:
-    req = requests.post(
-        ANDROID_DEVICE + "/message", json={"number": phone, "text": message_body}
+    req = _session.post(
+        ANDROID_DEVICE + "/message",
+        data=orjson.dumps({"number": phone, "text": message_body}),
+        timeout=(2, 10),
     )
     return req.status_code
 
@@ -1,10 +1,11 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.cors import CORSMiddleware
 from tortoise.contrib.fastapi import register_tortoise
 
 from app.api.users import auth_backend, fastapi_users
-from app.core.config import DATABASE_URL
+from app.core.config import DATABASE_URL, GENERATE_SCHEMAS
 from app.routes import index, messages
 
 app = FastAPI(
@@ -17,6 +18,7 @@ app = FastAPI(
         "email": "revdev@protonmail.com",
     },
     license={"name": "MIT License", "url": "https://opensource.org/licenses/MIT"},
+    default_response_class=ORJSONResponse,
 )
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -52,5 +54,5 @@ register_tortoise(
     app,
     db_url=DATABASE_URL,
     modules={"models": ["app.models.models"]},
-    generate_schemas=True,
+    generate_schemas=GENERATE_SCHEMAS,
 )